@@ -4,13 +4,28 @@
 
 from __future__ import annotations
 
+import mmap
+import os
+import pickle
+import re
 import struct
-from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple, Union
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
+try:
+    import ahocorasick  # optional: pip install pyahocorasick (single-pass marker scan)
+except ImportError:
+    ahocorasick = None
+
 Scalar = Literal["byte", "float", "int32", "uint32"]
+# CDF contents as read (bytes), mapped (mmap) or being edited (bytearray)
+Buffer = Union[bytes, bytearray, mmap.mmap]
 
 try:
     import ctypes
@@ -23,7 +38,7 @@ except Exception:
 # -----------------------------
 # Data model
 # -----------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CdfFieldDef:
     name: str
     section: str
@@ -32,9 +47,25 @@ class CdfFieldDef:
     notes: str = ""
     optional: bool = True
     repeatable: bool = True
+    payload_size: int = field(init=False, repr=False, compare=False)
+    marker_hex: str = field(init=False, repr=False, compare=False)
+    _struct: struct.Struct = field(init=False, repr=False, compare=False)
+    _decode: PayloadDecoder = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        # compiled once per definition; parse/encode never re-parse a format string
+        object.__setattr__(self, "_struct", _struct_for(self.layout))
+        object.__setattr__(self, "payload_size", self._struct.size)
+        object.__setattr__(self, "_decode", _decoder_for(self.layout))
+        object.__setattr__(self, "marker_hex", self.marker.hex(" "))
 
-@dataclass
+    def __reduce__(self):
+        # _struct/_decode are derived from layout (and not picklable); rebuild them on load
+        return (CdfFieldDef, (self.name, self.section, self.marker, self.layout,
+                              self.notes, self.optional, self.repeatable))
+
+
+@dataclass(slots=True)
 class CdfFieldInstance:
     definition: CdfFieldDef
     occurrence: int
@@ -43,84 +74,323 @@ class CdfFieldInstance:
     raw_value_bytes: bytes
     value: Tuple[Any, ...]
 
+    @property
+    def key(self) -> int:
+        """Identity of this field occurrence, stable across re-parses with the same definitions."""
+        return id(self.definition) << 32 | self.occurrence
+
 
 # -----------------------------
 # Binary helpers
 # -----------------------------
-_FMT: Dict[Scalar, Tuple[str, int]] = {
-    "byte":   ("<B", 1),
-    "float":  ("<f", 4),
-    "int32":  ("<i", 4),
-    "uint32": ("<I", 4),
-}
-
-def find_all(haystack: bytes, needle: bytes) -> List[int]:
-    out: List[int] = []
-    i = 0
-    while True:
-        j = haystack.find(needle, i)
-        if j < 0:
-            return out
-        out.append(j)
-        i = j + 1
-
-def decode_payload(layout: Tuple[Scalar, ...], data: bytes, off: int) -> Tuple[Tuple[Any, ...], int, bytes]:
-    vals: List[Any] = []
-    start = off
-    for t in layout:
-        fmt, n = _FMT[t]
-        chunk = data[off:off+n]
-        if len(chunk) != n:
+_LAYOUT_FMT: Dict[Scalar, str] = {"byte": "B", "float": "f", "int32": "i", "uint32": "I"}
+
+# compiled Struct per distinct layout; filled as definitions are created, so after
+# import it holds every layout in CDF_DEFS
+LAYOUT_STRUCT: Dict[Tuple[Scalar, ...], struct.Struct] = {}
+
+def _struct_for(layout: Tuple[Scalar, ...]) -> struct.Struct:
+    s = LAYOUT_STRUCT.get(layout)
+    if s is None:
+        s = LAYOUT_STRUCT[layout] = struct.Struct("<" + "".join(_LAYOUT_FMT[t] for t in layout))
+    return s
+
+# Scan tables derived from a definition list, built once per list object. A snapshot of the
+# contents is kept alongside, so appending to or editing the list (or a reused id) rebuilds.
+_DEFS_CACHE: Dict[Tuple[str, int], Tuple[Tuple[CdfFieldDef, ...], Any]] = {}
+
+def _cached_for_defs(kind: str, defs: List[CdfFieldDef], build: Callable[[List[CdfFieldDef]], Any]) -> Any:
+    hit = _DEFS_CACHE.get((kind, id(defs)))
+    if hit is not None and hit[0] == tuple(defs):
+        return hit[1]
+    value = build(defs)
+    if len(_DEFS_CACHE) >= 16:
+        _DEFS_CACHE.clear()
+    _DEFS_CACHE[(kind, id(defs))] = (tuple(defs), value)
+    return value
+
+# (index in defs, marker length, payload decoder or None, definition):
+# everything the parse loop needs per hit, resolved once instead of per attribute access
+DispatchEntry = Tuple[int, int, Optional["PayloadDecoder"], CdfFieldDef]
+
+def _build_dispatch(defs: List[CdfFieldDef]) -> Tuple[DispatchEntry, ...]:
+    return tuple(
+        (i, len(d.marker), d._decode if d.layout else None, d)
+        for i, d in enumerate(defs)
+    )
+
+def _build_output_order(defs: List[CdfFieldDef]) -> List[List[int]]:
+    # def indices grouped by (section, name) in sorted order, each group in defs order;
+    # parse output is the per-definition hit lists laid out in this order
+    groups: Dict[Tuple[str, str], List[int]] = {}
+    for i, d in enumerate(defs):
+        groups.setdefault((d.section, d.name), []).append(i)
+    return [groups[k] for k in sorted(groups)]
+
+def _build_automaton(defs: List[CdfFieldDef]) -> Any:
+    # one word per distinct marker carrying every entry that uses it (add_word replaces, so
+    # definitions sharing a marker must be stored together)
+    by_marker: Dict[bytes, List[DispatchEntry]] = {}
+    for e in _cached_for_defs("dispatch", defs, _build_dispatch):
+        by_marker.setdefault(e[3].marker, []).append(e)
+    A = ahocorasick.Automaton()
+    for marker, entries in by_marker.items():
+        # default pyahocorasick builds are str-keyed; latin-1 maps bytes 1:1 onto code points
+        A.add_word(marker.decode("latin-1") if ahocorasick.unicode else marker, tuple(entries))
+    A.make_automaton()
+    return A
+
+def _trie_pattern(markers: List[bytes]) -> bytes:
+    # alternation factored by common prefix, so re tests each candidate byte once
+    root: Dict[int, Any] = {}
+    for m in markers:
+        node = root
+        for b in m:
+            node = node.setdefault(b, {})
+        node[-1] = {}  # end of a marker
+
+    def emit(node: Dict[int, Any]) -> bytes:
+        alts = [re.escape(bytes((b,))) + emit(child) for b, child in sorted(node.items()) if b >= 0]
+        if not alts:
+            return b""
+        if len(alts) == 1 and -1 not in node:
+            return alts[0]
+        body = b"(?:" + b"|".join(alts) + b")"
+        return body + b"?" if -1 in node else body
+
+    return emit(root)
+
+@dataclass(frozen=True)
+class _MarkerRegex:
+    pattern: "re.Pattern[bytes]"
+    by_marker: Dict[bytes, List[DispatchEntry]]
+    # first byte -> lengths of the markers starting with it, longest first
+    by_first: Dict[int, Tuple[int, ...]]
+    # marker -> offsets inside it where another marker could also start; finditer resumes
+    # after each match, so those (and shorter markers sharing its start) are checked by hand
+    inner: Dict[bytes, Tuple[int, ...]]
+
+def _build_marker_regex(defs: List[CdfFieldDef]) -> _MarkerRegex:
+    by_marker: Dict[bytes, List[DispatchEntry]] = {}
+    for e in _cached_for_defs("dispatch", defs, _build_dispatch):
+        by_marker.setdefault(e[3].marker, []).append(e)
+    markers = list(by_marker)
+
+    # another marker can start k bytes into a when one of them is a prefix of the other's
+    # overlap a[k:] (at k == 0, a itself does not count)
+    marker_set = set(markers)
+    proper_prefixes = {m[:n] for m in markers for n in range(1, len(m))}
+    inner: Dict[bytes, Tuple[int, ...]] = {}
+    for a in markers:
+        ks = tuple(k for k in range(len(a)) if a[k:] in proper_prefixes or any(
+            a[k:k+n] in marker_set for n in range(1, len(a) - k + (k > 0))))
+        if ks:
+            inner[a] = ks
+
+    return _MarkerRegex(
+        pattern=re.compile(_trie_pattern(markers)),
+        by_marker=by_marker,
+        by_first={b: tuple(sorted({len(m) for m in markers if m[0] == b}, reverse=True))
+                  for b in {m[0] for m in markers}},
+        inner=inner,
+    )
+
+def _scan_by_regex(blob: Buffer, rx: _MarkerRegex) -> Iterator[Tuple[int, DispatchEntry]]:
+    by_marker, by_first, inner = rx.by_marker, rx.by_first, rx.inner
+    for m in rx.pattern.finditer(blob):
+        i = m.start()
+        marker = m.group()
+        for e in by_marker[marker]:
+            yield i, e
+        for k in inner.get(marker, ()):
+            p = i + k
+            if p >= len(blob):
+                break
+            for n in by_first.get(blob[p], ()):
+                cand = bytes(blob[p:p+n])
+                if len(cand) < n:
+                    continue
+                if k == 0 and cand == marker:
+                    continue
+                for e in by_marker.get(cand, ()):
+                    yield p, e
+
+def _scan_hits(blob: Buffer, defs: List[CdfFieldDef]) -> Iterator[Tuple[int, DispatchEntry]]:
+    if ahocorasick is not None:
+        A = _cached_for_defs("ac", defs, _build_automaton)
+        text = str(blob, "latin-1") if ahocorasick.unicode else blob
+        for end_idx, entries in A.iter(text):
+            start = end_idx - entries[0][1] + 1
+            for e in entries:
+                yield start, e
+        return
+    yield from _scan_by_regex(blob, _cached_for_defs("re", defs, _build_marker_regex))
+
+def prepare_scan_tables(defs: List[CdfFieldDef]) -> None:
+    """Build the dispatch table and marker automaton (or regex fallback) for defs up front."""
+    _cached_for_defs("dispatch", defs, _build_dispatch)
+    _cached_for_defs("order", defs, _build_output_order)
+    if ahocorasick is not None:
+        _cached_for_defs("ac", defs, _build_automaton)
+    else:
+        _cached_for_defs("re", defs, _build_marker_regex)
+
+PayloadDecoder = Callable[[Buffer, int], Tuple[Tuple[Any, ...], int, bytes]]
+
+@lru_cache(maxsize=None)
+def _decoder_for(layout: Tuple[Scalar, ...]) -> PayloadDecoder:
+    # one specialised closure per distinct layout, with size and unpack_from bound up front
+    if not layout:
+        return lambda data, off: ((), off, b"")
+    s = _struct_for(layout)
+    size, unpack_from = s.size, s.unpack_from
+
+    def decode(data: Buffer, off: int) -> Tuple[Tuple[Any, ...], int, bytes]:
+        end = off + size
+        if end > len(data):
+            # report the scalar that runs off the end, at its own offset
+            for t in layout:
+                n = struct.calcsize("<" + _LAYOUT_FMT[t])
+                if off + n > len(data):
+                    break
+                off += n
             raise ValueError(f"EOF decoding {t} at {off:#x}")
-        vals.append(struct.unpack(fmt, chunk)[0])
-        off += n
-    return tuple(vals), off, data[start:off]
+        return unpack_from(data, off), end, bytes(data[off:end])
+    return decode
 
-def encode_payload(layout: Tuple[Scalar, ...], values: Tuple[Any, ...]) -> bytes:
+def encode_payload_into(layout: Tuple[Scalar, ...], values: Tuple[Any, ...], out: bytearray, off: int) -> int:
+    """Pack values straight into out at off (no intermediate bytes); returns the end offset."""
     if len(values) != len(layout):
         raise ValueError(f"Value arity mismatch (expected {len(layout)} got {len(values)})")
-    out = bytearray()
-    for t, v in zip(layout, values):
-        fmt, _n = _FMT[t]
-        out += struct.pack(fmt, v)
-    return bytes(out)
-
-def parse_cdfbin(blob: bytes, defs: List[CdfFieldDef]) -> List[CdfFieldInstance]:
-    instances: List[CdfFieldInstance] = []
-    occ_map: Dict[Tuple[str, str, str], int] = {}
-    for d in defs:
-        positions = find_all(blob, d.marker)
-        if not positions:
-            continue
-
-        key = (d.section, d.name, d.marker.hex(" "))
-        for pos in positions:
-            occ = occ_map.get(key, 0)
-            occ_map[key] = occ + 1
-
-            val_off = pos + len(d.marker)
-            value, _end, raw = decode_payload(d.layout, blob, val_off)
-            instances.append(CdfFieldInstance(
-                definition=d,
-                occurrence=occ,
-                offset_marker=pos,
-                offset_value=val_off,
-                raw_value_bytes=raw,
-                value=value
-            ))
-
-    instances.sort(key=lambda i: (i.definition.section, i.definition.name, i.occurrence))
-    return instances
-
-def read_u32le(blob: bytes, off: int) -> int:
-    if off < 0 or off + 4 > len(blob):
-        raise ValueError(f"read_u32le out of bounds at {off:#x}")
-    return struct.unpack_from("<I", blob, off)[0]
+    s = _struct_for(layout)
+    if off < 0 or off + s.size > len(out):
+        raise ValueError(f"encode_payload_into out of bounds at {off:#x}")
+    prev = bytes(out[off:off + s.size])
+    try:
+        s.pack_into(out, off, *values)
+    except (struct.error, OverflowError):
+        out[off:off + s.size] = prev  # pack_into stops part-way on a bad value; undo it
+        raise
+    return off + s.size
+
+def parse_cdfbin(blob: Buffer, defs: List[CdfFieldDef]) -> List[CdfFieldInstance]:
+    # marker offsets per definition index; hits arrive in offset order per definition
+    found: List[List[int]] = [[] for _ in defs]
+    for pos, e in _scan_hits(blob, defs):
+        found[e[0]].append(pos)
+
+    # slices of bytes (or an mmap) are bytes already; other buffers are snapshotted once
+    data = blob if isinstance(blob, (bytes, mmap.mmap)) else bytes(blob)
+    n = len(data)
+    hits: List[List[CdfFieldInstance]] = []
+    for (_idx, mlen, decode, d), ps in zip(_cached_for_defs("dispatch", defs, _build_dispatch), found):
+        if not ps:
+            hits.append([])
+        elif decode is None:
+            # marker-only definition
+            hits.append([CdfFieldInstance(d, k, p, p + mlen, b"", ()) for k, p in enumerate(ps)])
+        else:
+            size = d.payload_size
+            if ps[-1] + mlen + size > n:
+                decode(data, next(p for p in ps if p + mlen + size > n) + mlen)  # raises the EOF error
+            # each definition's payloads decode in one iter_unpack over their joined bytes
+            raws = [data[p + mlen:p + mlen + size] for p in ps]
+            values = d._struct.iter_unpack(b"".join(raws))
+            hits.append([CdfFieldInstance(d, k, p, p + mlen, raw, value)
+                         for k, (p, raw, value) in enumerate(zip(ps, raws, values))])
+
+    # concatenating in (section, name) order replaces a sort; definitions sharing a
+    # section/name are interleaved by occurrence (then defs order), as the sort did
+    out: List[CdfFieldInstance] = []
+    for group in _cached_for_defs("order", defs, _build_output_order):
+        if len(group) == 1:
+            out += hits[group[0]]
+        else:
+            out += sorted((i for j in group for i in hits[j]), key=attrgetter("occurrence"))
+    return out
+
+def parse_cdf_file(path: str, defs: Optional[List[CdfFieldDef]] = None) -> List[CdfFieldInstance]:
+    """Parse a CDF file through a read-only memory map instead of reading it into bytes."""
+    if defs is None:
+        defs = CDF_DEFS
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return parse_cdfbin(b"", defs)  # zero-length files cannot be mapped
+        # instances only keep copied raw_value_bytes, so the mapping can close right after
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_cdfbin(mm, defs)
+
+# Batch parsing: each worker process holds its own copy of the definitions and scan tables.
+_WORKER_DEFS: List[CdfFieldDef] = []
+
+def _init_parse_worker(defs: List[CdfFieldDef]) -> None:
+    global _WORKER_DEFS
+    _WORKER_DEFS = defs
+    # build the scan tables once per worker rather than on its first file
+    prepare_scan_tables(defs)
+
+# Runs first in every worker. A spawned worker (Windows, macOS) starts without this script,
+# which is not importable by name, so it is loaded from its path under the caller's module
+# name before the definitions are unpickled; a forked worker already has it.
+_WORKER_BOOTSTRAP = """\
+import importlib.util, pickle, sys
+if name not in sys.modules:
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+sys.modules[name]._init_parse_worker(pickle.loads(defs))
+"""
+
+def _parse_file_rows(path: str) -> List[Tuple[int, int, int, int, bytes, Tuple[Any, ...]]]:
+    # definitions travel back as indices so the caller re-attaches its own objects
+    index = {id(e[3]): e[0] for e in _cached_for_defs("dispatch", _WORKER_DEFS, _build_dispatch)}
+    return [(index[id(i.definition)], i.occurrence, i.offset_marker, i.offset_value, i.raw_value_bytes, i.value)
+            for i in parse_cdf_file(path, _WORKER_DEFS)]
+
+def parse_many(paths: List[str], defs: Optional[List[CdfFieldDef]] = None,
+               max_workers: Optional[int] = None) -> Dict[str, List[CdfFieldInstance]]:
+    """Parse several CDF files in parallel worker processes; returns path -> instances."""
+    if defs is None:
+        defs = CDF_DEFS
+    out: Dict[str, List[CdfFieldInstance]] = {}
+    worker_env = {"name": __name__, "path": os.path.abspath(__file__), "defs": pickle.dumps(defs)}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=exec,
+                             initargs=(_WORKER_BOOTSTRAP, worker_env)) as pool:
+        for path, rows in zip(paths, pool.map(_parse_file_rows, paths)):
+            out[path] = [CdfFieldInstance(defs[di], occ, om, ov, raw, val)
+                         for di, occ, om, ov, raw, val in rows]
+    return out
+
+@dataclass
+class CdfFieldColumns:
+    """Column-major values of every occurrence of one definition."""
+    definition: CdfFieldDef
+    offset_value: array                 # 'I': payload offset per occurrence
+    values: Tuple[array, ...]           # one typed column per layout scalar
+
+def field_columns(instances: List[CdfFieldInstance]) -> Dict[CdfFieldDef, CdfFieldColumns]:
+    """Regroup parsed instances into typed arrays per definition (occurrence order)."""
+    groups: Dict[CdfFieldDef, List[CdfFieldInstance]] = {}
+    for inst in instances:
+        groups.setdefault(inst.definition, []).append(inst)
+
+    out: Dict[CdfFieldDef, CdfFieldColumns] = {}
+    for d, group in groups.items():
+        values: Tuple[array, ...] = ()
+        if d.layout:
+            # one C-level decode over the concatenated payloads, then transpose into columns
+            rows = d._struct.iter_unpack(b"".join(i.raw_value_bytes for i in group))
+            values = tuple(array(_LAYOUT_FMT[t], col) for t, col in zip(d.layout, zip(*rows)))
+        out[d] = CdfFieldColumns(d, array("I", (i.offset_value for i in group)), values)
+    return out
+
+_U32LE = struct.Struct("<I")
 
 def write_u32le(buf: bytearray, off: int, v: int) -> None:
     if off < 0 or off + 4 > len(buf):
         raise ValueError(f"write_u32le out of bounds at {off:#x}")
-    struct.pack_into("<I", buf, off, int(v) & 0xFFFFFFFF)
+    _U32LE.pack_into(buf, off, int(v) & 0xFFFFFFFF)
 
 @dataclass
 class ByteCountCheckResult:
@@ -129,12 +399,15 @@ class ByteCountCheckResult:
     regs: Dict[str, int]
     suggested: Optional[Dict[str, int]]  # new values for R0,R1,R2,R3 (if fixable)
 
-def check_byte_count_registers(blob: bytes) -> ByteCountCheckResult:
+# the 0x28-byte header as ten little-endian u32 words; R0/R1/R2/R3 are words 2/5/8/9
+_HEADER_WORDS = struct.Struct("<10I")
+
+def check_byte_count_registers(blob: Buffer) -> ByteCountCheckResult:
     file_len = len(blob)
-    R0 = read_u32le(blob, 0x0008)
-    R1 = read_u32le(blob, 0x0014)
-    R2 = read_u32le(blob, 0x0020)
-    R3 = read_u32le(blob, 0x0024)
+    if file_len < _HEADER_WORDS.size:
+        raise ValueError(f"CDF header out of bounds: need {_HEADER_WORDS.size:#x} bytes, file has {file_len:#x}")
+    words = _HEADER_WORDS.unpack_from(blob, 0)
+    R0, R1, R2, R3 = words[2], words[5], words[8], words[9]
 
     regs = {"R0_file_len": R0, "R1_mid_len": R1, "R2_end_len": R2, "R3_end_start": R3}
 
@@ -193,19 +466,20 @@ def check_byte_count_registers(blob: bytes) -> ByteCountCheckResult:
 
     return ByteCountCheckResult(ok=ok, problems=problems, regs=regs, suggested=suggested)
 
-def apply_byte_count_fix(blob: bytes, suggested: Dict[str, int]) -> bytes:
-    out = bytearray(blob)
-    write_u32le(out, 0x0008, suggested["R0_file_len"])
-    write_u32le(out, 0x0014, suggested["R1_mid_len"])
-    write_u32le(out, 0x0020, suggested["R2_end_len"])
-    write_u32le(out, 0x0024, suggested["R3_end_start"])
-    return bytes(out)
+def patch_byte_count_registers(buf: bytearray, suggested: Dict[str, int]) -> None:
+    """Write the suggested R0..R3 values into buf's header in place (16 bytes, no blob copy)."""
+    write_u32le(buf, 0x0008, suggested["R0_file_len"])
+    write_u32le(buf, 0x0014, suggested["R1_mid_len"])
+    write_u32le(buf, 0x0020, suggested["R2_end_len"])
+    write_u32le(buf, 0x0024, suggested["R3_end_start"])
 
 
 # -----------------------------
 # CDF definitions (STARTER SET)
 # -----------------------------
+@lru_cache(maxsize=None)
 def hx(s: str) -> bytes:
+    # cached: repeated marker strings share one bytes object and skip re-tokenising
     return bytes.fromhex(s)
 
 CDF_DEFS: List[CdfFieldDef] = [
@@ -561,26 +835,41 @@ CDF_DEFS: List[CdfFieldDef] = [
     CdfFieldDef("GearSevenSetting",        "DRIVELINE", hx("20 49 EE 13 F6"), ("byte",), "GearSevenSetting={byte}"),
 ]
 
+# the built-in table never changes: build its automaton once at import, not on first open
+prepare_scan_tables(CDF_DEFS)
+
 
 
 # -----------------------------
 # Hex view helpers
 # -----------------------------
-def is_printable(b: int) -> bool:
-    return 32 <= b <= 126
+# byte -> itself if printable ASCII, else "."
+_ASCII_MAP = bytes(c if 32 <= c <= 126 else 0x2E for c in range(256))
+# text column of byte i's first hex digit in a dump line ("00000000  " is 10 chars)
+_HEX_COLS = tuple(10 + i * 3 for i in range(16))
 
-def format_hex_lines(blob: bytes, start: int, nbytes: int, bytes_per_line: int = 16) -> List[str]:
+def format_hex_lines(blob: Buffer, start: int, nbytes: int, bytes_per_line: int = 16) -> List[str]:
     """Return classic hex dump lines (offset  hex...  ascii)."""
     end = min(len(blob), start + nbytes)
     lines: List[str] = []
     for off in range(start, end, bytes_per_line):
         chunk = blob[off:off+bytes_per_line]
-        hex_part = " ".join(f"{x:02X}" for x in chunk)
+        hex_part = chunk.hex(" ").upper()
         hex_part = hex_part.ljust(bytes_per_line * 3 - 1)
-        ascii_part = "".join(chr(x) if is_printable(x) else "." for x in chunk)
+        ascii_part = chunk.translate(_ASCII_MAP).decode("ascii")
         lines.append(f"{off:08X}  {hex_part}  |{ascii_part}|")
     return lines
 
+@lru_cache(maxsize=None)
+def _formatter_for(layout: Tuple[Scalar, ...]) -> Callable[[Tuple[Any, ...]], str]:
+    # one str.format template per layout: floats as %.6g, integers as-is; 1 scalar -> no parens
+    if not layout:
+        return lambda value: "(marker only)"
+    specs = ["{:.6g}" if t == "float" else "{:d}" for t in layout]
+    template = specs[0] if len(specs) == 1 else "(" + ", ".join(specs) + ")"
+    fmt = template.format
+    return lambda value: fmt(*value)
+
 def clamp(n: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, n))
 
@@ -588,6 +877,18 @@ def clamp(n: int, lo: int, hi: int) -> int:
 # -----------------------------
 # UI
 # -----------------------------
+FieldKey = int  # CdfFieldInstance.key
+
+@dataclass
+class _TreeSection:
+    """One section node of the field tree; its rows are inserted the first time it is opened."""
+    sid: str
+    name_lower: str
+    rows: List[Tuple[FieldKey, str, str, Tuple[str, str, str]]]  # (key, label, label lower, values)
+    iids: Optional[List[str]] = None   # row iids, parallel to rows, once inserted
+    shown: List[int] = field(default_factory=list)  # rows passing the current filter
+
+
 class CdfEditorApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -596,10 +897,13 @@ class CdfEditorApp(tk.Tk):
 
         self.file_path: Optional[str] = None
         self.original_blob: Optional[bytes] = None
-        self.working_blob: Optional[bytes] = None
+        self.working_blob: Optional[bytearray] = None  # edited in place; original_blob stays untouched
         self.instances: List[CdfFieldInstance] = []
+        self._instance_by_key: Dict[FieldKey, CdfFieldInstance] = {}
 
-        self.edits: Dict[Tuple[str, str, str, int], Tuple[Any, ...]] = {}
+        self.edits: Dict[FieldKey, Tuple[Any, ...]] = {}
+        # payload bytes of every field in original_blob, parsed on the first revert after open
+        self._original_raw: Optional[Dict[FieldKey, bytes]] = None
 
         # selection state
         self._selected_instance: Optional[CdfFieldInstance] = None
@@ -609,14 +913,60 @@ class CdfEditorApp(tk.Tk):
         self.hex_bytes_per_page = 16 * 64      # 64 lines of 16 bytes = 1024 bytes per page
         self.hex_anchor = 0                    # start offset shown in hex view (aligned)
         self._hex_line_index: Dict[int, int] = {}  # offset->line map for current view
+        # bumped on every change to working_blob; with the anchor it keys the rendered page
+        self._edits_version = 0
+        self._hex_cache: Optional[Tuple[int, int, int]] = None  # (anchor, id(blob), version) shown
+        # byte ranges written since the page was drawn; None = whole blob replaced
+        self._hex_dirty: Optional[List[Tuple[int, int]]] = None
+        self._suppress_hex_refresh = False  # set while a selection highlight drives the refresh
         # click-to-tree mapping: key -> iid, and offset->instance ranges
-        self._cdf_iid_by_key: Dict[Tuple[str, str, str, int], str] = {}
-        self._known_ranges: List[Tuple[int, int, Tuple[str, str, str, int]]] = []  # [start,end) -> key
+        self._iid_to_key: Dict[str, FieldKey] = {}  # inserted tree rows -> field key
+        self._cdf_iid_by_key: Dict[FieldKey, str] = {}
+        # field tree sections by iid, and filtered-in keys whose section rows are not inserted yet
+        self._tree_sections: Dict[str, _TreeSection] = {}
+        self._cdf_pending_key: Dict[FieldKey, str] = {}
+        self._known_ranges: List[Tuple[int, int, FieldKey]] = []  # [start,end) -> key
+        # 16-byte row offset -> indices of the _known_ranges entries touching that row, ascending
+        self._range_bucket: Dict[int, List[int]] = {}
+        self._filter_job: Optional[str] = None  # pending debounced tree rebuild
 
 
         self._build_menu()
         self._build_layout()
 
+    # Keys the Text class binds to edits. Everything else (navigation, <<Copy>>, Ctrl+Tab,
+    # Alt/Command menu and shortcut keys) is left to the class and "all" bindings.
+    _EDIT_KEYS = frozenset({"BackSpace", "Delete", "Return", "KP_Enter", "Insert"})
+    _CONTROL_EDIT_KEYS = frozenset({"d", "h", "i", "k", "o", "t"})
+    _META_EDIT_KEYS = frozenset({"d"})  # Meta is the Alt key on many X11 setups
+    _CONTROL_MASK = 0x4
+    _ALT_MASK = 0x8 | 0x20000  # Mod1 (Alt on X11, Command on macOS) | Alt on Windows
+
+    def _make_readonly(self, w: tk.Text):
+        """Block user edits but leave w in "normal" state, so code writes need no state toggles."""
+        w.bind("<Key>", self._readonly_key)
+        for seq in ("<<Cut>>", "<<Paste>>", "<<PasteSelection>>", "<<Clear>>", "<<Undo>>", "<<Redo>>"):
+            w.bind(seq, lambda _e: "break")
+
+    def _readonly_key(self, evt):
+        ks = evt.keysym
+        # these edit whatever the modifiers, except Control+Insert, which is Copy
+        if ks in self._EDIT_KEYS and not (ks == "Insert" and evt.state & self._CONTROL_MASK):
+            return "break"
+        if evt.state & self._CONTROL_MASK:
+            return "break" if ks in self._CONTROL_EDIT_KEYS else None
+        if evt.state & self._ALT_MASK:
+            return "break" if ks in self._META_EDIT_KEYS else None
+        if ks == "Tab" and not evt.state & 0x1:
+            # the class binding would insert a tab; move focus on, as a disabled Text does
+            nxt = evt.widget.tk_focusNext()
+            if nxt is not None:
+                nxt.focus_set()
+            return "break"
+        if evt.char and evt.char.isprintable():
+            return "break"
+        return None
+
     def _build_menu(self):
         m = tk.Menu(self)
         fm = tk.Menu(m, tearoff=0)
@@ -664,7 +1014,7 @@ class CdfEditorApp(tk.Tk):
 
         ttk.Label(topbar, text="Filter:").pack(side="left")
         self.filter_var = tk.StringVar()
-        self.filter_var.trace_add("write", lambda *_: self._rebuild_tree())
+        self.filter_var.trace_add("write", lambda *_: self._on_filter_change())
         ttk.Entry(topbar, textvariable=self.filter_var, width=40).pack(side="left", padx=6)
 
         self.status_var = tk.StringVar(value="Open a .cdfbin to begin.")
@@ -686,6 +1036,7 @@ class CdfEditorApp(tk.Tk):
         ysb.pack(side="right", fill="y")
 
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<<TreeviewOpen>>", self._on_tree_open)
 
         # ---------------- right panel ----------------
         ttk.Label(right, text="Selected field", font=("Segoe UI", 11, "bold")).pack(anchor="w")
@@ -693,8 +1044,8 @@ class CdfEditorApp(tk.Tk):
         self.sel_title = tk.StringVar(value="(none)")
         ttk.Label(right, textvariable=self.sel_title, wraplength=500).pack(anchor="w", pady=(4, 8))
 
-        self.meta_text = tk.Text(right, height=8, width=55, wrap="word")
-        self.meta_text.configure(state="disabled")
+        self.meta_text = tk.Text(right, height=8, width=55, wrap="word", insertwidth=0)
+        self._make_readonly(self.meta_text)
         self.meta_text.pack(fill="x", pady=(0, 10))
 
         ttk.Label(right, text="Edit values", font=("Segoe UI", 10, "bold")).pack(anchor="w")
@@ -745,12 +1096,11 @@ class CdfEditorApp(tk.Tk):
         hex_mid = ttk.Frame(hexpane)
         hex_mid.pack(fill="both", expand=True)
 
-        self.hex_text = tk.Text(hex_mid, height=18, wrap="none")
+        self.hex_text = tk.Text(hex_mid, height=18, wrap="none", insertwidth=0)
         self.hex_text.configure(font=("Consolas", 10))
         self.hex_text.tag_configure("sel_marker", background="#FFF2CC")  # pale yellow
         self.hex_text.tag_configure("sel_value",  background="#D9EAD3")  # pale green
-        self.hex_text.tag_configure("sel_both",   background="#D0E0E3")  # pale blue
-        self.hex_text.configure(state="disabled")
+        self._make_readonly(self.hex_text)
         # click in hex view should jump selection in tree (if known)
         self.hex_text.bind("<Button-1>", self._on_hex_click)
 
@@ -807,7 +1157,8 @@ class CdfEditorApp(tk.Tk):
 
         self.file_path = path
         self.original_blob = blob
-        self.working_blob = blob
+        self._original_raw = None
+        self.working_blob = bytearray(blob)
         chk = check_byte_count_registers(self.working_blob)
         if not chk.ok:
             msg = "Byte Count Registers check failed:\n\n"
@@ -817,11 +1168,12 @@ class CdfEditorApp(tk.Tk):
                 for k, v in chk.suggested.items():
                     msg += f"  {k}: {chk.regs.get(k)} -> {v}\n"
                 if messagebox.askyesno("Bad CDF header", msg + "\nApply repair now?"):
-                    self.working_blob = apply_byte_count_fix(self.working_blob, chk.suggested)
+                    patch_byte_count_registers(self.working_blob, chk.suggested)
             else:
                 messagebox.showwarning("Bad CDF header", msg + "\n\nNo safe automatic repair was determined.")
 
         self.edits.clear()
+        self._note_blob_change()
 
         self.refresh_parse()
 
@@ -865,9 +1217,8 @@ class CdfEditorApp(tk.Tk):
                     msg + "\nApply repair before saving?"
                 ):
                     try:
-                        self.working_blob = apply_byte_count_fix(
-                            self.working_blob, chk.suggested
-                        )
+                        patch_byte_count_registers(self.working_blob, chk.suggested)
+                        self._note_blob_change(0x08, 0x20)
                     except Exception as e:
                         messagebox.showerror(
                             "Header repair failed",
@@ -907,8 +1258,9 @@ class CdfEditorApp(tk.Tk):
             return
         if not messagebox.askyesno("Discard edits", "Discard ALL unsaved edits and revert to file state at open?"):
             return
-        self.working_blob = self.original_blob
+        self.working_blob = bytearray(self.original_blob)
         self.edits.clear()
+        self._note_blob_change()
         self.refresh_parse()
         self._refresh_hex_view()
 
@@ -923,12 +1275,13 @@ class CdfEditorApp(tk.Tk):
         except Exception as e:
             messagebox.showerror("Parse failed", str(e))
             return
+        self._instance_by_key = {i.key: i for i in self.instances}
 
         found = len(self.instances)
         self.status_var.set(
             f"Loaded: {self.file_path or '(unsaved)'} | Found {found} field instances | Edits: {len(self.edits)}"
         )
-        self._rebuild_tree()
+        self._populate_tree()
         self._rebuild_known_ranges()
 
 
@@ -941,43 +1294,106 @@ class CdfEditorApp(tk.Tk):
         # hex selection cleared
         self._set_hex_target(None, None, label="(none)")
 
-    def _rebuild_tree(self):
+    def _on_filter_change(self):
+        # rebuild once typing pauses rather than on every keystroke
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(150, self._run_filter)
+
+    def _run_filter(self):
+        self._filter_job = None
+        self._rebuild_tree()
+
+    def _populate_tree(self):
+        """Insert one node per section; rows are added when a section is opened."""
+        # sections the user had expanded stay expanded across a re-parse (after every edit)
+        was_open = {self.tree.item(sid, "text") for sid in self._tree_sections
+                    if self.tree.tk.getboolean(self.tree.item(sid, "open"))}
+        # re-link filtered-out items first so delete() below reaches every one
+        for sec in self._tree_sections.values():
+            if sec.iids is not None:
+                self.tree.set_children(sec.sid, *sec.iids)
+        self.tree.set_children("", *self._tree_sections)
         self.tree.delete(*self.tree.get_children())
-        filter_txt = self.filter_var.get().strip().lower()
+        self._iid_to_key.clear()
+        self._tree_sections = {}
 
         sections: Dict[str, List[CdfFieldInstance]] = {}
         for inst in self.instances:
-            label = f"{inst.definition.name} #{inst.occurrence}"
-            if filter_txt:
-                if filter_txt not in inst.definition.section.lower() and filter_txt not in inst.definition.name.lower():
-                    if filter_txt not in label.lower():
-                        continue
             sections.setdefault(inst.definition.section, []).append(inst)
 
-        # map iid -> key
-        self.tree._cdf_key_map = {}
-        self._cdf_iid_by_key.clear()
-
-
         for section in sorted(sections.keys()):
-            sid = self.tree.insert("", "end", text=section, open=True)
+            rows = []
             for inst in sections[section]:
-                marker_hex = inst.definition.marker.hex(" ")
-                key = (inst.definition.section, inst.definition.name, marker_hex, inst.occurrence)
-
-                shown_val = self.edits.get(key, inst.value)
-                val_str = self._format_value(shown_val, inst.definition.layout)
-                typ_str = ",".join(inst.definition.layout) if inst.definition.layout else "(none)"
-                off_str = f"{inst.offset_value:#x}"
-
-                iid = self.tree.insert(
-                    sid, "end",
-                    text=f"{inst.definition.name} #{inst.occurrence}",
-                    values=(val_str, typ_str, off_str)
+                key = inst.key
+                label = f"{inst.definition.name} #{inst.occurrence}"
+                values = (
+                    self._format_value(self.edits.get(key, inst.value), inst.definition.layout),
+                    ",".join(inst.definition.layout) if inst.definition.layout else "(none)",
+                    f"{inst.offset_value:#x}",
                 )
-                self.tree._cdf_key_map[iid] = key
-                self._cdf_iid_by_key[key] = iid
+                rows.append((key, label, label.lower(), values))
+            reopen = section in was_open
+            sid = self.tree.insert("", "end", text=section, open=reopen)
+            self.tree.insert(sid, "end", text="…")  # placeholder so the node shows an expander
+            sec = self._tree_sections[sid] = _TreeSection(sid, section.lower(), rows)
+            if reopen:
+                self._fill_section(sec)  # _rebuild_tree links the rows that pass the filter
 
+        self._rebuild_tree()
+
+    def _fill_section(self, sec: _TreeSection):
+        self.tree.delete(*self.tree.get_children(sec.sid))
+        sec.iids = []
+        for key, label, _label_l, values in sec.rows:
+            iid = self.tree.insert(sec.sid, "end", text=label, values=values)
+            self._iid_to_key[iid] = key
+            sec.iids.append(iid)
+
+    def _link_section(self, sec: _TreeSection):
+        iids = sec.iids
+        if iids is None:
+            return  # not filled yet; _fill_section runs first when it is opened
+        # children() replaces the child list in one call; rows left out are detached
+        self.tree.set_children(sec.sid, *(iids[i] for i in sec.shown))
+        for i in sec.shown:
+            key = sec.rows[i][0]
+            self._cdf_iid_by_key[key] = iids[i]
+            self._cdf_pending_key.pop(key, None)
+
+    def _rebuild_tree(self):
+        """Apply the filter by detaching/reattaching section nodes and any inserted rows."""
+        filter_txt = self.filter_var.get().strip().lower()
+        self._cdf_iid_by_key.clear()
+        self._cdf_pending_key.clear()
+
+        shown_sections: List[str] = []
+        for sec in self._tree_sections.values():
+            if not filter_txt or filter_txt in sec.name_lower:
+                sec.shown = list(range(len(sec.rows)))
+            else:
+                # the label starts with the field name, so this also covers name matches
+                sec.shown = [i for i, row in enumerate(sec.rows) if filter_txt in row[2]]
+            if not sec.shown:
+                continue
+            shown_sections.append(sec.sid)
+
+            if filter_txt and sec.iids is None:
+                self._fill_section(sec)  # show filter hits without an extra click
+            if sec.iids is None:
+                for i in sec.shown:
+                    self._cdf_pending_key[sec.rows[i][0]] = sec.sid
+            else:
+                self._link_section(sec)
+                if filter_txt:
+                    self.tree.item(sec.sid, open=True)
+        self.tree.set_children("", *shown_sections)
+
+    def _on_tree_open(self, _evt):
+        sec = self._tree_sections.get(self.tree.focus())
+        if sec is not None and sec.iids is None:
+            self._fill_section(sec)
+            self._link_section(sec)
 
     def _on_select(self, _evt):
         sel = self.tree.selection()
@@ -985,8 +1401,8 @@ class CdfEditorApp(tk.Tk):
             return
         iid = sel[0]
 
-        key_map = getattr(self.tree, "_cdf_key_map", {})
-        if iid not in key_map:
+        key = self._iid_to_key.get(iid)
+        if key is None:
             self._selected_instance = None
             self.sel_title.set("(section)")
             self._set_meta("")
@@ -994,7 +1410,6 @@ class CdfEditorApp(tk.Tk):
             self._highlight_selected_in_hex(None)
             return
 
-        key = key_map[iid]
         inst = self._find_instance_by_key(key)
         if not inst:
             self._selected_instance = None
@@ -1007,8 +1422,8 @@ class CdfEditorApp(tk.Tk):
         self._selected_instance = inst
         self.sel_title.set(f"{inst.definition.section} / {inst.definition.name} #{inst.occurrence}")
 
-        marker_hex = inst.definition.marker.hex(" ")
-        current = self.edits.get((inst.definition.section, inst.definition.name, marker_hex, inst.occurrence), inst.value)
+        marker_hex = inst.definition.marker_hex
+        current = self.edits.get(inst.key, inst.value)
 
         meta = (
             f"Marker: [{marker_hex}]\n"
@@ -1026,13 +1441,8 @@ class CdfEditorApp(tk.Tk):
         # Jump hex view and highlight marker+payload
         self._highlight_selected_in_hex(inst)
 
-    def _find_instance_by_key(self, key: Tuple[str, str, str, int]) -> Optional[CdfFieldInstance]:
-        section, name, marker_hex, occ = key
-        marker = bytes.fromhex(marker_hex)
-        for inst in self.instances:
-            if inst.definition.section == section and inst.definition.name == name and inst.definition.marker == marker and inst.occurrence == occ:
-                return inst
-        return None
+    def _find_instance_by_key(self, key: FieldKey) -> Optional[CdfFieldInstance]:
+        return self._instance_by_key.get(key)
 
     # -----------------------------
     # Scalar editor
@@ -1082,20 +1492,16 @@ class CdfEditorApp(tk.Tk):
         if inst is None or self.working_blob is None:
             return
 
-        marker_hex = inst.definition.marker.hex(" ")
-        key = (inst.definition.section, inst.definition.name, marker_hex, inst.occurrence)
+        key = inst.key
 
         try:
             new_values = self._parse_editor_values(inst.definition.layout, self._editor_vars)
-            new_raw = encode_payload(inst.definition.layout, new_values)
-            if len(new_raw) != len(inst.raw_value_bytes):
+            if inst.definition.payload_size != len(inst.raw_value_bytes):
                 raise ValueError("Edit would change payload size (not allowed in-place).")
 
-            out = bytearray(self.working_blob)
-            start = inst.offset_value
-            out[start:start+len(new_raw)] = new_raw
-            self.working_blob = bytes(out)
+            encode_payload_into(inst.definition.layout, new_values, self.working_blob, inst.offset_value)
             self.edits[key] = new_values
+            self._note_blob_change(inst.offset_value, inst.definition.payload_size)
 
         except Exception as e:
             messagebox.showerror("Invalid edit", str(e))
@@ -1110,20 +1516,19 @@ class CdfEditorApp(tk.Tk):
         if inst is None or self.original_blob is None or self.working_blob is None:
             return
 
-        marker_hex = inst.definition.marker.hex(" ")
-        key = (inst.definition.section, inst.definition.name, marker_hex, inst.occurrence)
+        key = inst.key
         if key not in self.edits:
             return
 
         try:
-            orig_instances = parse_cdfbin(self.original_blob, [inst.definition])
-            match = next((oi for oi in orig_instances if oi.occurrence == inst.occurrence), None)
-            if match is None:
+            if self._original_raw is None:
+                self._original_raw = {oi.key: oi.raw_value_bytes for oi in parse_cdfbin(self.original_blob, CDF_DEFS)}
+            orig_raw = self._original_raw.get(key)
+            if orig_raw is None:
                 raise ValueError("Could not locate original instance to revert.")
 
-            out = bytearray(self.working_blob)
-            out[inst.offset_value:inst.offset_value+len(inst.raw_value_bytes)] = match.raw_value_bytes
-            self.working_blob = bytes(out)
+            self.working_blob[inst.offset_value:inst.offset_value+len(inst.raw_value_bytes)] = orig_raw
+            self._note_blob_change(inst.offset_value, len(inst.raw_value_bytes))
 
             del self.edits[key]
         except Exception as e:
@@ -1142,34 +1547,27 @@ class CdfEditorApp(tk.Tk):
             if t == "float":
                 out.append(float(s))
             else:
-                n = int(s, 16) if s.lower().startswith("0x") else int(s, 10)
-                if t == "byte" and not (0 <= n <= 255):
-                    raise ValueError(f"byte out of range: {n}")
-                out.append(n)
+                out.append(int(s, 16) if s.lower().startswith("0x") else int(s, 10))
+        # trial pack into scratch: struct enforces byte/int32/uint32 ranges before anything is written
+        st = _struct_for(layout)
+        try:
+            st.pack_into(bytearray(st.size), 0, *out)
+        except (struct.error, OverflowError) as e:
+            raise ValueError(f"Value out of range: {e}")
         return tuple(out)
 
     def _format_value(self, value: Tuple[Any, ...], layout: Tuple[Scalar, ...]) -> str:
-        if not layout:
-            return "(marker only)"
-        parts = []
-        for v, t in zip(value, layout):
-            if t == "float":
-                parts.append(f"{float(v):.6g}")
-            else:
-                parts.append(str(int(v)))
-        return parts[0] if len(parts) == 1 else "(" + ", ".join(parts) + ")"
+        return _formatter_for(layout)(value)
 
     def _set_meta(self, s: str):
-        self.meta_text.configure(state="normal")
-        self.meta_text.delete("1.0", "end")
-        self.meta_text.insert("1.0", s)
-        self.meta_text.configure(state="disabled")
+        self.meta_text.replace("1.0", "end", s)
 
     # -----------------------------
     # Hex viewer/editor
     # -----------------------------
     def _refresh_hex_view(self):
         if self.working_blob is None:
+            self._hex_cache = None
             self._set_hex_text("")
             self.hex_info_var.set("")
             return
@@ -1179,27 +1577,51 @@ class CdfEditorApp(tk.Tk):
         self.hex_anchor = (self.hex_anchor // 16) * 16
         self.hex_anchor = clamp(self.hex_anchor, 0, max(0, len(blob) - 1))
 
-        lines = format_hex_lines(blob, self.hex_anchor, self.hex_bytes_per_page, 16)
-        self._hex_line_index.clear()
-        # build an index: line start offset -> line number within this view
-        for idx, line in enumerate(lines):
-            # each line starts with 8 hex digits offset
-            off = int(line.split()[0], 16)
-            self._hex_line_index[off] = idx
-
-        self._set_hex_text("\n".join(lines) + ("\n" if lines else ""))
+        # same page of the same bytes is already on screen: only the highlight needs redoing
+        cache_key = (self.hex_anchor, id(blob), self._edits_version)
+        if cache_key != self._hex_cache:
+            if self._hex_cache is not None and self._hex_cache[:2] == cache_key[:2] and self._hex_dirty is not None:
+                # in-place writes on the page being shown: redraw just the lines they touched
+                self._redraw_hex_lines(self._hex_dirty)
+            else:
+                lines = format_hex_lines(blob, self.hex_anchor, self.hex_bytes_per_page, 16)
+                # line start offset -> line number within this view
+                self._hex_line_index = {self.hex_anchor + i * 16: i for i in range(len(lines))}
+                self._set_hex_text("\n".join(lines) + ("\n" if lines else ""))
+            self._hex_cache = cache_key
+            self._hex_dirty = []
 
         end = min(len(blob), self.hex_anchor + self.hex_bytes_per_page)
         self.hex_info_var.set(f"{self.hex_anchor:08X} .. {end:08X}  (size {len(blob)} bytes)")
 
-        # re-highlight selection if any
-        self._highlight_selected_in_hex(self._selected_instance, refresh_only=True)
+        # re-highlight selection if any (unless a selection change is about to do it)
+        if not self._suppress_hex_refresh:
+            self._highlight_selected_in_hex(self._selected_instance, refresh_only=True)
+
+    def _note_blob_change(self, start: Optional[int] = None, n: int = 0):
+        """Record a write to working_blob; no start means the whole blob was replaced."""
+        self._edits_version += 1
+        if start is None:
+            self._hex_dirty = None
+        elif self._hex_dirty is not None:
+            self._hex_dirty.append((start, start + n))
+
+    def _redraw_hex_lines(self, ranges: List[Tuple[int, int]]):
+        blob = self.working_blob
+        line_offs = sorted({
+            off
+            for start, end in ranges
+            for off in range((start // 16) * 16, end, 16)
+            if off in self._hex_line_index
+        })
+        if blob is None or not line_offs:
+            return
+        for off in line_offs:
+            line_no = self._hex_line_index[off] + 1
+            self.hex_text.replace(f"{line_no}.0", f"{line_no}.end", format_hex_lines(blob, off, 16, 16)[0])
 
     def _set_hex_text(self, s: str):
-        self.hex_text.configure(state="normal")
-        self.hex_text.delete("1.0", "end")
-        self.hex_text.insert("1.0", s)
-        self.hex_text.configure(state="disabled")
+        self.hex_text.replace("1.0", "end", s)
 
     def hex_page(self, direction: int):
         if self.working_blob is None:
@@ -1223,11 +1645,8 @@ class CdfEditorApp(tk.Tk):
 
     def _highlight_selected_in_hex(self, inst: Optional[CdfFieldInstance], refresh_only: bool = False):
         # clear old tags
-        self.hex_text.configure(state="normal")
         self.hex_text.tag_remove("sel_marker", "1.0", "end")
         self.hex_text.tag_remove("sel_value", "1.0", "end")
-        self.hex_text.tag_remove("sel_both", "1.0", "end")
-        self.hex_text.configure(state="disabled")
 
         if inst is None or self.working_blob is None:
             if not refresh_only:
@@ -1245,16 +1664,20 @@ class CdfEditorApp(tk.Tk):
             self.hex_anchor = (focus // 16) * 16
             # show a little context above if possible
             self.hex_anchor = clamp(self.hex_anchor - 16 * 4, 0, max(0, len(self.working_blob) - 1))
-            self._refresh_hex_view()  # this will call back into highlight with refresh_only=True, so guard:
-            # after refresh, we’ll tag below as well.
-            # (refresh_only is false here so we continue)
+            # the refresh would re-highlight (refresh_only=True) and then we'd tag again below;
+            # suppress its pass so this selection is tagged once
+            self._suppress_hex_refresh = True
+            try:
+                self._refresh_hex_view()
+            finally:
+                self._suppress_hex_refresh = False
 
         # set target for hex overwrite: default to payload (value bytes)
         self._set_hex_target(value_start, value_len,
                              label=f"{inst.definition.name} #{inst.occurrence} payload @ {value_start:08X} ({value_len} bytes)")
         # also fill edit box with current payload hex
-        payload = self.working_blob[value_start:value_start+value_len]
-        self.hex_edit_var.set(payload.hex(" ").upper())
+        with memoryview(self.working_blob) as mv:
+            self.hex_edit_var.set(mv[value_start:value_start+value_len].hex(" ").upper())
 
         # tag marker and payload in visible hex view
         self._tag_range_in_hex(marker_start, marker_len, "sel_marker")
@@ -1270,9 +1693,7 @@ class CdfEditorApp(tk.Tk):
         if idx is None:
             return
         # Tk text index is 1-based lines
-        self.hex_text.configure(state="normal")
         self.hex_text.see(f"{idx+1}.0")
-        self.hex_text.configure(state="disabled")
 
     def _tag_range_in_hex(self, start: int, length: int, tag: str):
         if self.working_blob is None:
@@ -1291,23 +1712,25 @@ class CdfEditorApp(tk.Tk):
 
         # mapping from byte offset in line to character position in our rendered line:
         # "00000000␠␠" (10 chars incl 2 spaces) + hex area (16*3-1 chars) + "␠␠|" + ascii + "|"
-        # For byte i (0..15): hex starts at col 10 + i*3, two chars wide.
-        def hex_col(byte_i: int) -> int:
-            return 10 + byte_i * 3
-
-        self.hex_text.configure(state="normal")
-        for off in range(sel_start, sel_end):
-            line_off = (off // 16) * 16
-            byte_i = off - line_off
+        # For byte i (0..15): hex starts at col _HEX_COLS[i], two chars wide; ascii char at col 60 + i.
+        ascii_col = 10 + (16 * 3 - 1) + 3
+
+        # per dump line: one hex span and one ascii span; every span goes in a single tag_add.
+        # Bounds are already clamped to the page, so a long payload costs at most a page of lines.
+        spans: List[str] = []
+        for line_off in range(sel_start & ~15, sel_end, 16):
             line_idx = self._hex_line_index.get(line_off)
             if line_idx is None:
                 continue
+            first = max(sel_start, line_off) - line_off
+            last = min(sel_end, line_off + 16) - line_off   # exclusive
             line_no = line_idx + 1
-
-            c0 = hex_col(byte_i)
-            c1 = c0 + 2
-            self.hex_text.tag_add(tag, f"{line_no}.{c0}", f"{line_no}.{c1}")
-        self.hex_text.configure(state="disabled")
+            spans.append(f"{line_no}.{_HEX_COLS[first]}")
+            spans.append(f"{line_no}.{_HEX_COLS[last - 1] + 2}")
+            spans.append(f"{line_no}.{ascii_col + first}")
+            spans.append(f"{line_no}.{ascii_col + last}")
+        if spans:
+            self.hex_text.tag_add(tag, *spans)
 
     def _set_hex_target(self, start: Optional[int], length: Optional[int], label: str):
         self._hex_sel_start = start
@@ -1326,6 +1749,14 @@ class CdfEditorApp(tk.Tk):
             return b""
         parts = s.replace(",", " ").split()
         try:
+            # usual "DE AD BE EF" input: one C call; as many bytes as parts means every part was a pair
+            data = bytes.fromhex(" ".join(parts))
+            if len(data) == len(parts):
+                return data
+        except ValueError:
+            pass
+        try:
+            # single digits / 0x-prefixed parts
             return bytes(int(p, 16) for p in parts)
         except Exception:
             raise ValueError("Hex bytes must be like: 'DE AD BE EF' (space-separated)")
@@ -1353,9 +1784,8 @@ class CdfEditorApp(tk.Tk):
             return
 
         # apply
-        out = bytearray(self.working_blob)
-        out[start:start+n] = new_bytes
-        self.working_blob = bytes(out)
+        self.working_blob[start:start+n] = new_bytes
+        self._note_blob_change(start, n)
 
         # After raw edits, re-parse definitions (some markers may change if you edit them)
         self.refresh_parse()
@@ -1374,9 +1804,8 @@ class CdfEditorApp(tk.Tk):
             messagebox.showerror("Revert failed", "Selected range is out of bounds of original file.")
             return
 
-        out = bytearray(self.working_blob)
-        out[start:start+n] = self.original_blob[start:start+n]
-        self.working_blob = bytes(out)
+        self.working_blob[start:start+n] = self.original_blob[start:start+n]
+        self._note_blob_change(start, n)
 
         self.refresh_parse()
         self._refresh_hex_view()
@@ -1386,8 +1815,7 @@ class CdfEditorApp(tk.Tk):
         """Build [start,end) ranges for every known marker/payload so hex clicks can resolve to a tree item."""
         self._known_ranges.clear()
         for inst in self.instances:
-            marker_hex = inst.definition.marker.hex(" ")
-            key = (inst.definition.section, inst.definition.name, marker_hex, inst.occurrence)
+            key = inst.key
 
             ms = inst.offset_marker
             ml = len(inst.definition.marker)
@@ -1400,7 +1828,11 @@ class CdfEditorApp(tk.Tk):
                 self._known_ranges.append((vs, vs + vl, key))
 
         # sort by start to make scanning predictable
-        self._known_ranges.sort(key=lambda r: r[0])
+        self._known_ranges.sort(key=itemgetter(0))
+        self._range_bucket = {}
+        for i, (start, end, _key) in enumerate(self._known_ranges):
+            for row in range(start & ~15, end, 16):
+                self._range_bucket.setdefault(row, []).append(i)
 
     def _hex_click_to_offset(self, event) -> Optional[int]:
         """
@@ -1419,18 +1851,9 @@ class CdfEditorApp(tk.Tk):
         except Exception:
             return None
 
-        # Get the full line text and parse the left offset ("00000000")
-        line_text = self.hex_text.get(f"{line_no}.0", f"{line_no}.end")
-        if not line_text.strip():
-            return None
-
-        parts = line_text.split()
-        if not parts:
-            return None
-
-        try:
-            line_base_off = int(parts[0], 16)
-        except Exception:
+        # the page is rendered as 16-byte lines from hex_anchor, so the line's offset is known
+        line_base_off = self.hex_anchor + (line_no - 1) * 16
+        if not (self.hex_anchor <= line_base_off < self.hex_anchor + self.hex_bytes_per_page):
             return None
 
         # Layout geometry for rendered lines:
@@ -1471,9 +1894,12 @@ class CdfEditorApp(tk.Tk):
 
         return None
 
-    def _find_key_for_offset(self, off: int) -> Optional[Tuple[str, str, str, int]]:
+    def _find_key_for_offset(self, off: int) -> Optional[FieldKey]:
         """Return the instance key if 'off' falls within any known marker/payload range."""
-        for start, end, key in self._known_ranges:
+        # only ranges touching off's 16-byte row can cover it; ranges may overlap, so
+        # return the first covering one in sorted order as a full scan would
+        for i in self._range_bucket.get(off & ~15, ()):
+            start, end, key = self._known_ranges[i]
             if start <= off < end:
                 return key
         return None
@@ -1493,7 +1919,13 @@ class CdfEditorApp(tk.Tk):
 
         iid = self._cdf_iid_by_key.get(key)
         if not iid:
-            return
+            sid = self._cdf_pending_key.get(key)
+            if sid is None:
+                return  # filtered out of the tree
+            sec = self._tree_sections[sid]
+            self._fill_section(sec)
+            self._link_section(sec)
+            iid = self._cdf_iid_by_key[key]
 
         # Select and scroll tree; this will trigger <<TreeviewSelect>> and reuse existing logic
         self.tree.selection_set(iid)
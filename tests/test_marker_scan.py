@@ -0,0 +1,94 @@
+"""Cross-check the marker scanners against a brute-force startswith() search.
+
+Run with:  python -m unittest discover -s tests
+"""
+import importlib.util
+import os
+import random
+import sys
+import unittest
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+cdf = sys.modules.get("cdf_editor")  # loaded once per run; other test modules share it
+if cdf is None:
+    _SPEC = importlib.util.spec_from_file_location("cdf_editor", os.path.join(_HERE, "..", "cdf_editorV0.2.py"))
+    cdf = importlib.util.module_from_spec(_SPEC)
+    sys.modules[_SPEC.name] = cdf  # dataclasses look the module up while the class is built
+    _SPEC.loader.exec_module(cdf)
+
+
+def brute_force_hits(blob, defs):
+    return sorted((p, i) for i, d in enumerate(defs)
+                  for p in range(len(blob)) if blob.startswith(d.marker, p))
+
+
+def make_defs(markers):
+    return [cdf.CdfFieldDef(f"f{i}", "S", m, ()) for i, m in enumerate(markers)]
+
+
+def make_blob(rnd, markers, n_items):
+    out = bytearray()
+    for _ in range(n_items):
+        if rnd.random() < 0.6:
+            out += rnd.choice(markers)
+        else:
+            out += bytes(rnd.choice(b"abc\x00") for _ in range(rnd.randint(0, 4)))
+    return bytes(out)
+
+
+# marker sets where matches overlap: shared prefixes, self-overlap, one marker inside another,
+# and two definitions with the same marker bytes
+OVERLAPPING_MARKER_SETS = [
+    [b"aa", b"aaa", b"a"],
+    [b"aba", b"ab", b"ba", b"bab"],
+    [b"abc", b"bc", b"c", b"cab"],
+    [b"aab", b"ab", b"aab", b"b\x00"],
+    [b"a\x00a", b"\x00a\x00", b"a"],
+]
+
+
+class MarkerScanTests(unittest.TestCase):
+
+    def check_scanners(self, blob, defs):
+        expected = brute_force_hits(blob, defs)
+        rx = cdf._build_marker_regex(defs)
+        self.assertEqual(sorted((p, e[0]) for p, e in cdf._scan_by_regex(blob, rx)), expected)
+        # whichever path is active here (Aho-Corasick when pyahocorasick is installed)
+        self.assertEqual(sorted((p, e[0]) for p, e in cdf._scan_hits(blob, defs)), expected)
+        self.assertEqual(sorted((p, e[0]) for p, e in cdf._scan_hits(bytearray(blob), defs)), expected)
+
+    def test_overlapping_markers(self):
+        rnd = random.Random(0)
+        for markers in OVERLAPPING_MARKER_SETS:
+            defs = make_defs(markers)
+            for _ in range(200):
+                with self.subTest(markers=markers):
+                    self.check_scanners(make_blob(rnd, markers, 30), defs)
+
+    def test_builtin_definitions(self):
+        rnd = random.Random(1)
+        markers = [d.marker for d in cdf.CDF_DEFS]
+        for _ in range(5):
+            blob = bytes(rnd.randbytes(rnd.randint(0, 8))).join(
+                rnd.choice(markers) + rnd.randbytes(rnd.randint(0, 12)) for _ in range(300))
+            self.check_scanners(blob, cdf.CDF_DEFS)
+
+    def test_shared_marker_keeps_every_definition(self):
+        defs = [cdf.CdfFieldDef("a", "S", b'" ', ()), cdf.CdfFieldDef("c", "T", b'" ', ("byte",))]
+        insts = cdf.parse_cdfbin(b'xx" \x05yy" \x07', defs)
+        self.assertEqual([(i.definition.name, i.offset_marker) for i in insts],
+                         [("a", 2), ("a", 7), ("c", 2), ("c", 7)])
+
+    def test_definitions_changed_in_place(self):
+        defs = [cdf.CdfFieldDef("a", "S", b"AA", ())]
+        blob = b"xAAyBBz"
+        self.assertEqual([i.definition.name for i in cdf.parse_cdfbin(blob, defs)], ["a"])
+        defs.append(cdf.CdfFieldDef("b", "S", b"BB", ()))
+        self.assertEqual([i.definition.name for i in cdf.parse_cdfbin(blob, defs)], ["a", "b"])
+        defs[0] = cdf.CdfFieldDef("a", "S", b"yB", ())
+        self.assertEqual([(i.definition.name, i.offset_marker) for i in cdf.parse_cdfbin(blob, defs)],
+                         [("a", 3), ("b", 4)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Parse results checked against the original editor's behaviour.
+
+Run with:  python -m unittest discover -s tests
+"""
+import functools
+import importlib.util
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+cdf = sys.modules.get("cdf_editor")  # loaded once per run; other test modules share it
+if cdf is None:
+    _SPEC = importlib.util.spec_from_file_location("cdf_editor", os.path.join(_HERE, "..", "cdf_editorV0.2.py"))
+    cdf = importlib.util.module_from_spec(_SPEC)
+    sys.modules[_SPEC.name] = cdf  # dataclasses look the module up while the class is built
+    _SPEC.loader.exec_module(cdf)
+
+
+DEFS = [
+    cdf.CdfFieldDef("speed", "S", b"\x11\x22", ("float",)),
+    cdf.CdfFieldDef("gear", "S", b"\x33\x44", ("byte", "int32")),
+    cdf.CdfFieldDef("flag", "T", b"\x55", ()),
+]
+
+
+# two definitions share section "Aero" and name "wing"; their instances are merged by occurrence
+ORDER_DEFS = [
+    cdf.CdfFieldDef("wing", "Aero", b"\x01\x02", ("byte",)),
+    cdf.CdfFieldDef("gear", "Drive", b"\x03", ("byte",)),
+    cdf.CdfFieldDef("wing", "Aero", b"\x04\x05", ("byte",)),
+    cdf.CdfFieldDef("abs", "Aero", b"\x06", ()),
+]
+ORDER_BLOB = b"\x04\x05\x0a\x01\x02\x0b\x03\x0c\x01\x02\x0d\x06\x04\x05\x0e\x03\x0f"
+# (defs index, occurrence, marker offset, value), as the original sort by section/name/occurrence gave
+ORDER_EXPECTED = [
+    (3, 0, 11, ()),
+    (0, 0, 3, (11,)),
+    (2, 0, 0, (10,)),
+    (0, 1, 8, (13,)),
+    (2, 1, 12, (14,)),
+    (1, 0, 6, (12,)),
+    (1, 1, 15, (15,)),
+]
+
+
+def summary(instances, defs):
+    return [(defs.index(i.definition), i.occurrence, i.offset_marker, i.value) for i in instances]
+
+
+class ParseCdfbinTests(unittest.TestCase):
+
+    def test_output_order(self):
+        self.assertEqual(summary(cdf.parse_cdfbin(ORDER_BLOB, ORDER_DEFS), ORDER_DEFS), ORDER_EXPECTED)
+        self.assertEqual(summary(cdf.parse_cdfbin(bytearray(ORDER_BLOB), ORDER_DEFS), ORDER_DEFS),
+                         ORDER_EXPECTED)
+
+    def test_eof_message(self):
+        # the scalar that runs off the end is named, at its own offset
+        cases = [
+            (("float",), b"\x11\x22\x00\x00", "EOF decoding float at 0x2"),
+            (("byte", "float", "int32"), b"\x11\x22\x01\x00\x00\x00\x00\x00", "EOF decoding int32 at 0x7"),
+            (("int32", "int32"), b"\xaa\x11\x22" + bytes(6), "EOF decoding int32 at 0x7"),
+        ]
+        for layout, blob, message in cases:
+            with self.subTest(layout=layout):
+                with self.assertRaises(ValueError) as cm:
+                    cdf.parse_cdfbin(blob, [cdf.CdfFieldDef("n", "S", b"\x11\x22", layout)])
+                self.assertEqual(str(cm.exception), message)
+
+    def test_parse_cdf_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "car.cdf")
+            with open(path, "wb") as f:
+                f.write(ORDER_BLOB)
+            # read through a memory map
+            self.assertEqual(summary(cdf.parse_cdf_file(path, ORDER_DEFS), ORDER_DEFS), ORDER_EXPECTED)
+            with open(path, "wb"):
+                pass
+            # an empty file cannot be mapped
+            self.assertEqual(cdf.parse_cdf_file(path, ORDER_DEFS), [])
+
+
+def reference_parse_hex_bytes(s):
+    # the original parser: every part read with int(part, 16)
+    s = s.strip()
+    if not s:
+        return b""
+    try:
+        return bytes(int(p, 16) for p in s.replace(",", " ").split())
+    except Exception:
+        raise ValueError("Hex bytes must be like: 'DE AD BE EF' (space-separated)")
+
+
+class ParseHexBytesTests(unittest.TestCase):
+
+    PARTS = ["DE", "ad", "0", "f", "00", "7F", "0x1F", "0XFF", "100", "abc", "ABCD", "g1", "-1", "+a",
+             "1_0", "0x", "", ",", " ", "\t", "\n", ", ", "\u0661"]
+
+    def test_random_input(self):
+        rnd = random.Random(2)
+        for _ in range(5000):
+            s = "".join(rnd.choice(self.PARTS) + rnd.choice([" ", ",", "  ", ""]) for _ in range(rnd.randint(0, 6)))
+            try:
+                expected = reference_parse_hex_bytes(s)
+            except ValueError as e:
+                expected = str(e)
+            try:
+                got = cdf.CdfEditorApp._parse_hex_bytes(None, s)
+            except ValueError as e:
+                got = str(e)
+            self.assertEqual(got, expected, s)
+
+
+class ParseManyTests(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.paths = []
+        for n in range(3):
+            path = os.path.join(tmp.name, f"car{n}.cdf")
+            with open(path, "wb") as f:
+                f.write(b"\x00" * n + b"\x11\x22" + bytes([n]) * 4 + b"\x55\x33\x44" + bytes(5) * (n + 1))
+            self.paths.append(path)
+
+    def check_start_method(self, method):
+        if method not in multiprocessing.get_all_start_methods():
+            self.skipTest(f"{method} start method not available")
+        pool = functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context(method))
+        with mock.patch.object(cdf, "ProcessPoolExecutor", pool):
+            out = cdf.parse_many(self.paths, DEFS, max_workers=2)
+        self.assertEqual(list(out), self.paths)
+        for path in self.paths:
+            with open(path, "rb") as f:
+                self.assertEqual(out[path], cdf.parse_cdfbin(f.read(), DEFS))
+
+    def test_fork(self):
+        self.check_start_method("fork")
+
+    def test_spawn(self):
+        # the default on Windows and macOS: workers start without the editor script loaded
+        self.check_start_method("spawn")
+
+
+if __name__ == "__main__":
+    unittest.main()